@@ -1,16 +1,23 @@
 import sys
 import os
 import subprocess
-import threading
+import venv
 import logging
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QPushButton, QVBoxLayout, 
                              QWidget, QLabel, QLineEdit, QProgressBar, QCheckBox, 
-                             QFileDialog, QTextEdit, QGroupBox, QHBoxLayout)
-from PyQt5.QtCore import pyqtSignal, QThread, pyqtSlot
+                             QFileDialog, QPlainTextEdit, QGroupBox, QHBoxLayout)
+from PyQt5.QtCore import pyqtSignal, QThread, QTimer, pyqtSlot
 
-# Initialize logging for debugging and tracking
-logging.basicConfig(level=logging.INFO, filename='setup.log', filemode='w',
-                    format='%(asctime)s - %(levelname)s - %(message)s')
+# Library categories shown as checkbox groups: (title, libraries, checked by default).
+# The first half goes in the left column, the rest in the right column.
+CATEGORIES = [
+    ("Math/Data Science", ["numpy", "pandas", "scikit-learn"], []),
+    ("Web Development", ["flask", "beautifulsoup4", "requests", "streamlit"], []),
+    ("Visualization", ["matplotlib"], []),
+    ("GUI Development", ["PyQt5", "PyQt5Designer"], []),
+    ("Database", ["sqlalchemy", "psycopg2"], []),
+    ("Software Development Tools", ["pyinstaller", "pipreqs"], ["pipreqs"]),
+]
 
 class SetupThread(QThread):
     """
@@ -18,32 +25,38 @@ class SetupThread(QThread):
     """
     update_signal = pyqtSignal(str)
     error_signal = pyqtSignal(str)
+    progress_signal = pyqtSignal(int)
+    busy_signal = pyqtSignal(bool)
 
-    def __init__(self, folder, libs, additional_libs, progressBar, messageArea, cancelFlag):
+    def __init__(self, folder, libs, additional_libs):
         QThread.__init__(self)
-        self.folder = folder
-        self.libs = libs
-        self.additional_libs = additional_libs
-        self.progressBar = progressBar
-        self.messageArea = messageArea
-        self.cancelFlag = cancelFlag
-        self.totalSteps = 2 + len(libs) + len(additional_libs)
+        # Absolute, so the venv interpreter path still resolves when pip runs
+        # with cwd=self.folder; an empty field stays empty and is rejected in run()
+        self.folder = os.path.abspath(folder) if folder else folder
+        # Strip, drop blanks and dedupe once; dict keeps the selection order
+        self.libs_clean = list(dict.fromkeys(s for s in (lib.strip() for lib in libs + additional_libs) if s))
+        # Navigating, two venv steps, src folder and the pip run; pip's own
+        # output can't be counted up front, so the bar shows busy meanwhile
+        self.totalSteps = 5
         self.completedSteps = 0
+        self._current = None
+        self._py = None
 
     def run(self):
         try:
             if not os.path.isdir(self.folder):
                 raise Exception("Invalid folder path")
-            os.chdir(self.folder)
             self.increment_progress("Navigating to folder...")
 
             self.createVenv()
             self.increment_progress("Creating virtual environment...")
 
-            self.updatePip()
             self.installLibs()
 
-            self.update_signal.emit("Setup complete!")
+            if self.isInterruptionRequested():
+                self.update_signal.emit("Setup canceled.")
+            else:
+                self.update_signal.emit("Setup complete!")
 
         except Exception as e:
             self.error_signal.emit(str(e))
@@ -54,68 +67,113 @@ class SetupThread(QThread):
         # Create venv
         venv_path = os.path.join(self.folder, 'venv')
         if not os.path.exists(venv_path):
-            subprocess.run(["python", "-m", "venv", "venv"], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            if getattr(sys, "frozen", False):
+                # In the bundled exe sys.executable is the GUI itself, so the
+                # venv has to come from the python on PATH
+                subprocess.run(["python", "-m", "venv", venv_path],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            else:
+                venv.EnvBuilder(with_pip=True, symlinks=(os.name != "nt")).create(venv_path)
+        # Interpreter inside the venv, so pip installs land there rather than
+        # in the environment running this tool
+        if sys.platform == "win32":
+            self._py = os.path.join(venv_path, "Scripts", "python.exe")
+        else:
+            self._py = os.path.join(venv_path, "bin", "python")
         self.increment_progress("Creating venv...")
 
-    def updatePip(self):
-        # Update pip
-        subprocess.run([sys.executable, "-m", "pip", "install", "--upgrade", "pip"],
-                       stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        self.increment_progress("Updating pip...")
-
     def installLibs(self):
+        # Canceled during venv creation: don't create src or start pip
+        if self.isInterruptionRequested():
+            return
         # Create src folder
-        os.makedirs("src", exist_ok=True)
+        os.makedirs(os.path.join(self.folder, "src"), exist_ok=True)
         self.increment_progress("Creating src folder...")
-        # Install libraries
-        for lib in self.libs + self.additional_libs:
-            if lib.strip():
-                subprocess.run([sys.executable, "-m", "pip", "install", lib.strip()],
-                               stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                self.increment_progress(f"Installing {lib}...")
-                if self.cancelFlag.is_set():
-                    self.update_signal.emit("Setup canceled.")
-                    return
+        # Update pip and install libraries in a single pip run so the resolver
+        # and downloader are only bootstrapped once
+        self.update_signal.emit("Updating pip and installing libraries...")
+        returncode = self.runPip()
+        if self.isInterruptionRequested():
+            return
+        if returncode != 0:
+            # One unresolvable name (e.g. a typo in "Other") fails the whole batch
+            raise Exception(f"pip install failed (exit {returncode})")
+        self.increment_progress("Libraries installed.")
+
+    def runPip(self):
+        """
+        Run 'pip install --upgrade pip <libs>' and report its progress.
+        Returns pip's exit code.
+        """
+        # --prefer-binary picks the newest release that has a wheel, so nothing
+        # is compiled unless a package publishes no wheels at all (e.g.
+        # psycopg2 on Linux, or docopt which pipreqs depends on)
+        self.busy_signal.emit(True)
+        try:
+            process = subprocess.Popen([self._py, "-m", "pip", "install", "--progress-bar", "off",
+                                        "--use-feature=fast-deps", "--prefer-binary",
+                                        "--upgrade", "pip", *self.libs_clean],
+                                       cwd=self.folder, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                       bufsize=-1, text=True)
+            self._current = process
+            # Cancel may have been clicked before the process handle was stored
+            if self.isInterruptionRequested():
+                process.terminate()
+            # Relay pip's output as it arrives
+            for line in process.stdout:
+                line = line.rstrip()
+                if line:
+                    self.update_signal.emit(line)
+            returncode = process.wait()
+        finally:
+            self._current = None
+            self.busy_signal.emit(False)
+        return returncode
+
+    def cancel(self):
+        """
+        Request interruption and stop the running pip process, killing it
+        if it hasn't exited a second after being asked to terminate.
+        """
+        self.requestInterruption()
+        process = self._current
+        if process is not None and process.poll() is None:
+            process.terminate()
+            QTimer.singleShot(1000, lambda: self.killIfRunning(process))
+
+    @staticmethod
+    def killIfRunning(process):
+        if process.poll() is None:
+            process.kill()
 
     def increment_progress(self, message):
-        if self.cancelFlag.is_set():
+        if self.isInterruptionRequested():
             return
         self.completedSteps += 1
         progress = int((self.completedSteps / self.totalSteps) * 100)
-        self.progressBar.setValue(progress)
+        self.progress_signal.emit(progress)
         self.update_signal.emit(message)
 
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
+        self._checkboxMap = []
+        self._categoriesBuilt = False
+        self.setupThread = None
         self.initUI()
-        self.cancelFlag = threading.Event()
+        # Buffer messages and flush them to the message area 50 ms after the
+        # first one is queued
+        self._msgBuf = []
+        self._msgTimer = QTimer(self, interval=50, singleShot=True)
+        self._msgTimer.timeout.connect(self.flushMessages)
 
     def initUI(self):
         mainLayout = QVBoxLayout()
 
-        # Two-column layout for categories
-        categoriesLayout = QHBoxLayout()
-        leftColumn, rightColumn = QVBoxLayout(), QVBoxLayout()
-        # Add categories to leftColumn and rightColumn
-        # Left column for the first half of the categories:
-        leftColumn.addWidget(self.createCategoryGroup("Math/Data Science", ["numpy", "pandas", "scikit-learn"]))
-        leftColumn.addWidget(self.createCategoryGroup("Web Development", ["flask", "beautifulsoup4", "requests", "streamlit"]))
-        leftColumn.addWidget(self.createCategoryGroup("Visualization", ["matplotlib"]))
-        # Righ column for second half of the categories:
-        rightColumn.addWidget(self.createCategoryGroup("GUI Development", ["PyQt5", "PyQt5Designer"]))
-        rightColumn.addWidget(self.createCategoryGroup("Database", ["sqlalchemy", "psycopg2"]))
-        #rightColumn.addWidget(self.createCategoryGroup("Software Development Tools", ["pyinstaller", "pipreqs"]))
-        # --Start-- Find the pipreqs checkbox and set it checked by default (replaces above line) --Start--
-        devToolsGroup = self.createCategoryGroup("Software Development Tools", ["pyinstaller", "pipreqs"])
-        for widget in devToolsGroup.findChildren(QCheckBox):
-            if widget.text() == "pipreqs":
-                widget.setChecked(True)
-        rightColumn.addWidget(devToolsGroup)
-        # --End-- Modification to add 'pipreqs' and set it to be auto-checked --End--
-        categoriesLayout.addLayout(leftColumn)
-        categoriesLayout.addLayout(rightColumn)
-        mainLayout.addLayout(categoriesLayout)
+        # Two-column layout for categories, filled in once the window is shown
+        # (see showEvent)
+        self.categoriesLayout = QHBoxLayout()
+        mainLayout.addLayout(self.categoriesLayout)
 
         # Other Libraries input
         self.additionalLibsInput = QLineEdit(self)
@@ -132,8 +190,9 @@ class MainWindow(QMainWindow):
         self.startButton = QPushButton('Start', self)
         self.cancelButton = QPushButton('Cancel', self)
         self.progressBar = QProgressBar(self)
-        self.messageArea = QTextEdit(self)
+        self.messageArea = QPlainTextEdit(self)
         self.messageArea.setReadOnly(True)
+        self.messageArea.setMaximumBlockCount(500)
 
         mainLayout.addWidget(QLabel('Select Target Folder:'))
         mainLayout.addWidget(self.folderInput)
@@ -152,15 +211,40 @@ class MainWindow(QMainWindow):
         self.startButton.clicked.connect(self.startSetup)
         self.cancelButton.clicked.connect(self.cancelSetup)
 
-    def createCategoryGroup(self, title, libraries):
+    def showEvent(self, event):
+        """
+        Build the category groups the first time the window is shown, once
+        the skeleton layout has been handed to the window system.
+        """
+        super().showEvent(event)
+        if not self._categoriesBuilt:
+            self._categoriesBuilt = True
+            QTimer.singleShot(0, self._buildCategories)
+
+    def _buildCategories(self):
+        """
+        Add the category groups to the two-column categories layout.
+        """
+        leftColumn, rightColumn = QVBoxLayout(), QVBoxLayout()
+        # Add categories to leftColumn and rightColumn
+        half = (len(CATEGORIES) + 1) // 2
+        for index, (title, libraries, defaults) in enumerate(CATEGORIES):
+            column = leftColumn if index < half else rightColumn
+            column.addWidget(self.createCategoryGroup(title, libraries, defaults))
+        self.categoriesLayout.addLayout(leftColumn)
+        self.categoriesLayout.addLayout(rightColumn)
+
+    def createCategoryGroup(self, title, libraries, defaults=()):
         """
-        Create a group box for a category of libraries.
+        Create a group box for a category of libraries, checking those in defaults.
         """
         group = QGroupBox(title)
         groupLayout = QVBoxLayout()
         for lib in libraries:
             checkbox = QCheckBox(lib, self)
+            checkbox.setChecked(lib in defaults)
             groupLayout.addWidget(checkbox)
+            self._checkboxMap.append((checkbox, lib))
         group.setLayout(groupLayout)
         return group
 
@@ -178,38 +262,66 @@ class MainWindow(QMainWindow):
         """
         target_folder = self.folderInput.text()
         additional_libs = self.additionalLibsInput.text().split(',')
-        selected_libs = [cb.text() for cb in self.findChildren(QCheckBox) if cb.isChecked()]
+        selected_libs = [name for cb, name in self._checkboxMap if cb.isChecked()]
 
-        self.setupThread = SetupThread(target_folder, selected_libs, additional_libs,
-                                       self.progressBar, self.messageArea, self.cancelFlag)
+        self.setupThread = SetupThread(target_folder, selected_libs, additional_libs)
         self.setupThread.update_signal.connect(self.updateMessage)
         self.setupThread.error_signal.connect(self.showErrorMessage)
+        self.setupThread.progress_signal.connect(self.progressBar.setValue)
+        self.setupThread.busy_signal.connect(self.setProgressBusy)
         self.setupThread.start()
 
+    @pyqtSlot(bool)
+    def setProgressBusy(self, busy):
+        """
+        Switch the progress bar to busy mode while pip is running.
+        """
+        self.progressBar.setRange(0, 0 if busy else 100)
+
     @pyqtSlot(str)
     def updateMessage(self, message):
         """
         Update the message area with the given message.
         """
-        self.messageArea.append(message)
+        self.queueMessage(message)
 
     @pyqtSlot(str)
     def showErrorMessage(self, error_message):
         """
         Display an error message in the message area.
         """
-        self.messageArea.append("Error: " + error_message)
+        self.queueMessage("Error: " + error_message)
+
+    def queueMessage(self, message):
+        """
+        Buffer a message and arm the flush timer if it isn't already running.
+        """
+        self._msgBuf.append(message)
+        if not self._msgTimer.isActive():
+            self._msgTimer.start()
+
+    def flushMessages(self):
+        """
+        Append any buffered messages to the message area in one go.
+        """
+        if self._msgBuf:
+            self.messageArea.appendPlainText("\n".join(self._msgBuf))
+            self._msgBuf.clear()
 
     def cancelSetup(self):
         """
         Signal the setup thread to stop the setup process.
         """
-        self.cancelFlag.set()
+        if self.setupThread is not None:
+            self.setupThread.cancel()
 
 def main():
     """
     Main function to start the application.
     """
+    # Initialize logging for debugging and tracking
+    logging.basicConfig(level=logging.INFO, filename='setup.log', filemode='w',
+                        format='%(asctime)s - %(levelname)s - %(message)s')
     app = QApplication(sys.argv)
     mainWin = MainWindow()
     mainWin.show()